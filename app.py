@@ -1,14 +1,448 @@
-from flask import Flask, render_template
+from flask import Flask, render_template, request
 from flask_cors import CORS
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from process_identifier import ProcessIdentifier
+import orjson
 import psutil
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from array import array
+from collections import namedtuple
+from operator import attrgetter
+
+
+
+def _orjson_default(obj):
+    """Serialize namedtuples (e.g. psutil connection addresses) as lists, like the stdlib json module"""
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonModule:
+    """Stand-in for the stdlib json module when encoding Socket.IO packets
+
+    Performance: process_update carries hundreds of process dicts every refresh,
+    and orjson serializes them several times faster than the stdlib encoder.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # python-socketio passes stdlib-only options like separators; orjson output is already compact
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", json=OrjsonModule)
 identifier = ProcessIdentifier()
 
+# Performance: Reuse psutil.Process objects across socket events so repeated
+# kill/details requests for the same PID don't re-read /proc to build a new one
+_PROC_CACHE: dict[int, psutil.Process] = {}
+
+# Seconds a SIGTERMed process gets to exit before SIGKILL, and how often to check on it
+TERM_GRACE_PERIOD = 0.5
+_EXIT_POLL_INTERVAL = 0.02
+
+
+# Performance: A single background task scans processes and broadcasts the result,
+# so scan cost stays constant no matter how many clients are connected
+# The collector sleeps 5x as long as its last scan took, which keeps its CPU use
+# around 20%, clamped to these bounds (seconds). MIN_INTERVAL is the normal refresh rate
+MIN_INTERVAL = 2.0
+MAX_INTERVAL = 5.0
+_refresh_interval = MIN_INTERVAL
+# Keep the identifier's scan cache shorter than a tick, so every tick rescans (and the
+# interval is derived from real scan times) while both views still share one walk
+identifier.cache_duration = _refresh_interval / 2
+_ROOMS = {False: 'processes:user', True: 'processes:all'}
+_subscribers: dict[bool, set] = {False: set(), True: set()}
+_last_snapshot: dict[bool, dict] = {}
+_last_system_info: dict = {}
+_snapshot_lock = threading.Lock()
+_collector_started = False
+
+
+# Process fields sent to the client in process_update, one column each
+PROCESS_COLUMNS = (
+    'pid', 'name', 'cpu_percent', 'memory_percent', 'memory_mb', 'status', 'username',
+    'num_threads', 'create_time', 'listening_ports', 'cmdline', 'parent_pid', 'parent_name',
+    'description', 'app_name', 'category', 'is_user_process', 'cwd', 'in_user_directory',
+    'related_processes',
+)
+_process_row = attrgetter(*PROCESS_COLUMNS)
+
+
+# Numeric process fields sent as packed little-endian binary arrays, keyed to their
+# array typecode ('i' = int32, 'f' = float32, 'B' = uint8); the client reads them as
+# typed arrays. 'B' columns are percentages rounded to whole numbers and capped at 255
+# (CPU can exceed 100% across cores), so the raw byte value is the percent
+BINARY_COLUMNS = {
+    'pid': 'i',
+    'cpu_percent': 'B',
+    'memory_percent': 'B',
+    'memory_mb': 'f',
+    'num_threads': 'i',
+}
+
+
+def _pack_processes(processes):
+    """Pack ProcInfo records into parallel columns
+
+    Performance: a list of dicts repeats every key name once per process on the
+    wire; columns send each key once and shrink both the payload and encode time.
+    Numeric columns go out as Socket.IO binary attachments, 4 bytes per value
+    instead of a decimal string.
+    """
+    # Performance: one attrgetter call per record pulls every field in C, and zip(*)
+    # transposes the rows into columns
+    rows = map(_process_row, processes)
+    column_values = zip(*rows) if processes else ((),) * len(PROCESS_COLUMNS)
+
+    columns = {}
+    for col, values in zip(PROCESS_COLUMNS, column_values):
+        typecode = BINARY_COLUMNS.get(col)
+        if typecode:
+            if typecode == 'B':
+                values = [min(max(round(value), 0), 255) for value in values]
+            packed = array(typecode, values)
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            values = packed.tobytes()
+
+        columns[col] = values
+
+    return {
+        'count': len(processes),
+        'columns': columns,
+        'binary_columns': BINARY_COLUMNS,
+    }
+
+
+def _collect_system_info():
+    """Sample system-wide CPU and memory usage once and cache it for the current tick"""
+    global _last_system_info
+
+    # Performance: Use interval=None for non-blocking CPU check
+    # This returns the average CPU usage since last call, not blocking
+    system_info = {
+        'cpu_percent': psutil.cpu_percent(interval=None),
+        'memory_percent': psutil.virtual_memory().percent,
+        'refresh_interval': _refresh_interval
+    }
+
+    with _snapshot_lock:
+        _last_system_info = system_info
+    return system_info
+
+
+def _collect_snapshot(show_all):
+    """Scan processes for one view mode and store the resulting process_update payload"""
+    if show_all:
+        processes = identifier.get_all_processes_enhanced()
+    else:
+        # Default to showing only user-initiated processes
+        processes = identifier.get_user_processes()
+
+    with _snapshot_lock:
+        snapshot = {
+            'processes': _pack_processes(processes),
+            'system_info': _last_system_info
+        }
+        _last_snapshot[show_all] = snapshot
+    return snapshot
+
+
+def _collector():
+    """Background task: rescan periodically and push updates to subscribed clients"""
+    global _refresh_interval
+
+    while True:
+        scan_start = time.perf_counter()
+
+        if any(_subscribers.values()):
+            # System-wide stats are sampled once per tick and shared by every view
+            _collect_system_info()
+
+        for show_all, sids in _subscribers.items():
+            # Don't scan for a view nobody is watching
+            if not sids:
+                continue
+            try:
+                snapshot = _collect_snapshot(show_all)
+                socketio.emit('process_update', snapshot, to=_ROOMS[show_all])
+            except Exception as e:
+                print(f'Process scan failed: {e}')
+
+        # Back off when scans are slow (many processes) so they can't pile up
+        scan_time = time.perf_counter() - scan_start
+        _refresh_interval = max(MIN_INTERVAL, min(MAX_INTERVAL, 5 * scan_time))
+        identifier.cache_duration = _refresh_interval / 2
+        socketio.sleep(_refresh_interval)
+
+
+def _start_collector():
+    """Start the background collector once per server process"""
+    global _collector_started
+    with _snapshot_lock:
+        if _collector_started:
+            return
+        _collector_started = True
+
+    # Initialize CPU monitoring for non-blocking calls. psutil.cpu_percent(interval=None)
+    # measures since the previous call, so the very first reading is always 0.0; sampling
+    # here primes it no matter how the app is launched and gives the first snapshot a value
+    _collect_system_info()
+    socketio.start_background_task(_collector)
+
+
+def _unsubscribe(sid, show_all):
+    """Remove a client from a view mode, dropping that mode's snapshot once nobody watches it"""
+    _subscribers[show_all].discard(sid)
+    if not _subscribers[show_all]:
+        with _snapshot_lock:
+            _last_snapshot.pop(show_all, None)
+
+
+def _invalidate_snapshots():
+    """Drop every cached process list so the next request rescans (e.g. after a kill)"""
+    identifier.invalidate()
+    with _snapshot_lock:
+        _last_snapshot.clear()
+
+
+# Linux: read a single process's sockets straight from /proc/<pid> instead of
+# psutil's connections(), which cross-references the system-wide socket tables
+USE_PROC_NET_CONNECTIONS = psutil.LINUX
+
+# /proc/<pid>/net tables covered by connections(kind='inet')
+_PROC_NET_TABLES = (
+    ('tcp', socket.AF_INET, socket.SOCK_STREAM),
+    ('tcp6', socket.AF_INET6, socket.SOCK_STREAM),
+    ('udp', socket.AF_INET, socket.SOCK_DGRAM),
+    ('udp6', socket.AF_INET6, socket.SOCK_DGRAM),
+)
+
+# Hex TCP states in /proc/net/tcp* (include/net/tcp_states.h)
+_TCP_STATES = {
+    '01': psutil.CONN_ESTABLISHED,
+    '02': psutil.CONN_SYN_SENT,
+    '03': psutil.CONN_SYN_RECV,
+    '04': psutil.CONN_FIN_WAIT1,
+    '05': psutil.CONN_FIN_WAIT2,
+    '06': psutil.CONN_TIME_WAIT,
+    '07': psutil.CONN_CLOSE,
+    '08': psutil.CONN_CLOSE_WAIT,
+    '09': psutil.CONN_LAST_ACK,
+    '0A': psutil.CONN_LISTEN,
+    '0B': psutil.CONN_CLOSING,
+}
+
+# Same fields as the namedtuples psutil's connections() returns
+Connection = namedtuple('Connection', ['fd', 'family', 'type', 'laddr', 'raddr', 'status'])
+
+
+def _decode_proc_net_address(address, family):
+    """Decode a hex 'IP:PORT' field from /proc/net/tcp* into an (ip, port) tuple"""
+    ip_hex, port_hex = address.split(':')
+    port = int(port_hex, 16)
+    if not port:
+        return ()
+
+    ip_bytes = bytes.fromhex(ip_hex)
+    if sys.byteorder == 'little':
+        # The kernel prints the address as 32-bit words in host byte order
+        ip_bytes = b''.join(ip_bytes[i:i + 4][::-1] for i in range(0, len(ip_bytes), 4))
+    return socket.inet_ntop(family, ip_bytes), port
+
+
+def _connections_for_pid(pid):
+    """List a process's inet sockets by joining its socket fds with /proc/<pid>/net tables
+
+    Raises psutil.NoSuchProcess / psutil.AccessDenied like proc.connections() does.
+    """
+    fd_dir = f'/proc/{pid}/fd'
+    try:
+        fds = os.listdir(fd_dir)
+    except FileNotFoundError:
+        raise psutil.NoSuchProcess(pid)
+    except PermissionError:
+        raise psutil.AccessDenied(pid)
+
+    # Socket inode -> fd number for this process
+    socket_fds = {}
+    for fd in fds:
+        try:
+            target = os.readlink(f'{fd_dir}/{fd}')
+        except OSError:
+            continue  # fd was closed while we were looking
+        if target.startswith('socket:['):
+            socket_fds[target[8:-1]] = int(fd)
+
+    connections = []
+    if not socket_fds:
+        return connections
+
+    for table, family, sock_type in _PROC_NET_TABLES:
+        try:
+            with open(f'/proc/{pid}/net/{table}') as f:
+                next(f)  # Skip header
+                for line in f:
+                    fields = line.split()
+                    fd = socket_fds.get(fields[9])
+                    if fd is None:
+                        continue
+
+                    if sock_type == socket.SOCK_STREAM:
+                        status = _TCP_STATES.get(fields[3], psutil.CONN_NONE)
+                    else:
+                        status = psutil.CONN_NONE
+                    connections.append(Connection(
+                        fd, family, sock_type,
+                        _decode_proc_net_address(fields[1], family),
+                        _decode_proc_net_address(fields[2], family),
+                        status
+                    ))
+        except FileNotFoundError:
+            continue  # e.g. IPv6 disabled
+
+    return connections
+
+
+def _get_proc(pid):
+    """Return a cached psutil.Process for pid, creating a fresh one if the cached one exited
+
+    PIDs not requested before start from the identifier's Process for them, so e.g.
+    cpu_percent() measures since the last scan instead of returning 0.0 on first use.
+    """
+    proc = _PROC_CACHE.get(pid) or identifier.cached_process(pid)
+    if proc is not None:
+        # is_running() also compares create_time, so a reused PID is not mistaken for the old process
+        if proc.is_running():
+            _PROC_CACHE[pid] = proc
+            return proc
+        _PROC_CACHE.pop(pid, None)
+
+    proc = psutil.Process(pid)
+    _PROC_CACHE[pid] = proc
+    return proc
+
+
+def _signal_proc(proc, sig):
+    """Send sig to a process from _get_proc() with a single os.kill()
+
+    Performance: proc.terminate()/kill() re-read /proc to check for PID reuse before
+    signalling; _get_proc() has already done that check against the cached create_time.
+    """
+    try:
+        os.kill(proc.pid, sig)
+    except ProcessLookupError:
+        raise psutil.NoSuchProcess(proc.pid)
+    except PermissionError:
+        raise psutil.AccessDenied(proc.pid)
+
+
+def _is_alive(proc):
+    """True while proc runs and hasn't exited to a zombie awaiting its parent"""
+    try:
+        return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+def _wait_for_exit(still_running, timeout=TERM_GRACE_PERIOD):
+    """Poll still_running() until it returns False or timeout passes; returns its last result
+
+    Performance: returns as soon as the signalled processes exit (usually within the
+    first poll) instead of always sleeping for the full grace period. socketio.sleep
+    yields to other clients under eventlet/gevent between polls.
+    """
+    deadline = time.monotonic() + timeout
+    while still_running():
+        if time.monotonic() >= deadline:
+            return True
+        socketio.sleep(_EXIT_POLL_INTERVAL)
+    return False
+
+
+def _prune_proc_cache():
+    """Drop cached processes that are no longer running to keep the cache bounded"""
+    for pid, proc in list(_PROC_CACHE.items()):
+        if not proc.is_running():
+            del _PROC_CACHE[pid]
+
+
+def _kill_shared_process_group(main_pid, related_pids):
+    """Terminate main_pid and related_pids with one killpg() if they make up its process group
+
+    killpg() signals every member of the group, so this only applies when main_pid
+    leads the group and the group holds no PIDs beyond the requested ones.
+    Returns (killed_pids, failed_pids), or None when the caller should kill the
+    PIDs one by one instead.
+    """
+    if not related_pids or not hasattr(os, 'killpg'):
+        return None
+
+    try:
+        pgid = os.getpgid(main_pid)
+    except (ProcessLookupError, PermissionError):
+        return None
+
+    # Never signal our own process group, or one main_pid does not lead
+    if pgid != main_pid or pgid == os.getpgid(0):
+        return None
+
+    killed_pids = [main_pid]
+    failed_pids = []
+    for pid in related_pids:
+        try:
+            if os.getpgid(pid) != pgid:
+                return None
+            killed_pids.append(pid)
+        except ProcessLookupError:
+            failed_pids.append(pid)  # Already gone
+        except PermissionError:
+            return None
+
+    # The group must not contain anything the user did not ask to kill
+    for pid in psutil.pids():
+        try:
+            if os.getpgid(pid) == pgid and pid not in killed_pids:
+                return None
+        except ProcessLookupError:
+            pass  # Exited during the scan
+        except PermissionError:
+            return None
+
+    # Track the known PIDs rather than probing the group with signal 0, which also
+    # succeeds while an unreaped zombie remains; _is_alive() counts those as exited
+    signalled = []
+    for pid in killed_pids:
+        try:
+            signalled.append(_get_proc(pid))
+        except psutil.NoSuchProcess:
+            pass
+
+    os.killpg(pgid, signal.SIGTERM)
+
+    # Give processes a moment to terminate gracefully, then force kill anything left
+    if _wait_for_exit(lambda: any(_is_alive(proc) for proc in signalled)):
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # Exited between the last check and the kill
+
+    return killed_pids, failed_pids
+
 
 @app.route('/')
 def index():
@@ -19,37 +453,38 @@ def index():
 @socketio.on('connect')
 def handle_connect():
     print(f'Client connected')
+    _start_collector()
     emit('connected', {'message': 'Connected to process viewer'})
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
     print(f'Client disconnected')
+    for show_all in _subscribers:
+        _unsubscribe(request.sid, show_all)
+    _prune_proc_cache()
 
 
 @socketio.on('get_processes')
 def handle_get_processes(data=None):
-    """Send process list to client"""
+    """Subscribe client to process updates and send the latest snapshot"""
     try:
         # Check if we want only user processes or all
         show_all = data.get('show_all', False) if data else False
 
-        if show_all:
-            processes = identifier.get_all_processes_enhanced()
-        else:
-            # Default to showing only user-initiated processes
-            processes = identifier.get_user_processes()
-
-        # Performance: Use interval=None for non-blocking CPU check
-        # This returns the average CPU usage since last call, not blocking
-        system_info = {
-            'cpu_percent': psutil.cpu_percent(interval=None),
-            'memory_percent': psutil.virtual_memory().percent
-        }
-        emit('process_update', {
-            'processes': processes,
-            'system_info': system_info
-        })
+        # Move the client to the room for its view mode; the collector pushes updates there
+        leave_room(_ROOMS[not show_all])
+        _unsubscribe(request.sid, not show_all)
+        join_room(_ROOMS[show_all])
+        _subscribers[show_all].add(request.sid)
+
+        with _snapshot_lock:
+            snapshot = _last_snapshot.get(show_all)
+        if snapshot is None:
+            # Nothing collected for this view yet, scan once now
+            snapshot = _collect_snapshot(show_all)
+
+        emit('process_update', snapshot)
     except Exception as e:
         emit('error', {'message': str(e)})
 
@@ -59,8 +494,9 @@ def handle_kill_process(data):
     """Kill a process by PID"""
     try:
         pid = data.get('pid')
-        proc = psutil.Process(pid)
-        proc.terminate()
+        _signal_proc(_get_proc(pid), signal.SIGTERM)
+        # Don't let a cached list resurrect the process on the client's next request
+        _invalidate_snapshots()
         emit('process_killed', {'success': True, 'pid': pid})
     except psutil.NoSuchProcess:
         emit('process_killed', {'success': False, 'error': 'Process not found', 'pid': pid})
@@ -74,58 +510,62 @@ def handle_kill_process(data):
 def handle_kill_process_group(data):
     """Kill a process and all its related processes"""
     try:
-        import time
-
         main_pid = data.get('pid')
         related_pids = data.get('related_pids', [])
 
-        killed_pids = []
-        failed_pids = []
-
-        # Kill related processes first (children, bundled processes)
-        for pid in related_pids:
-            try:
-                proc = psutil.Process(pid)
-                proc.terminate()
-                killed_pids.append(pid)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                failed_pids.append(pid)
-
-        # Give processes a moment to terminate gracefully
-        time.sleep(0.5)
-
-        # Force kill any that didn't terminate
-        for pid in killed_pids[:]:
+        # Fast path: a single killpg() signals everything when the group shares a process group
+        group_result = _kill_shared_process_group(main_pid, related_pids)
+        if group_result is not None:
+            killed_pids, failed_pids = group_result
+        else:
+            killed_pids = []
+            failed_pids = []
+
+            # Kill related processes first (children, bundled processes)
+            for pid in related_pids:
+                try:
+                    _signal_proc(_get_proc(pid), signal.SIGTERM)
+                    killed_pids.append(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    failed_pids.append(pid)
+
+            # Give processes a moment to terminate gracefully. Use the cached objects:
+            # is_running() compares their create_time, so a PID recycled meanwhile is left alone
+            signalled = [_PROC_CACHE[pid] for pid in killed_pids if pid in _PROC_CACHE]
+            _wait_for_exit(lambda: any(_is_alive(proc) for proc in signalled))
+
+            # Force kill any that didn't terminate
+            for proc in signalled:
+                try:
+                    if _is_alive(proc):
+                        _signal_proc(proc, signal.SIGKILL)
+                except psutil.NoSuchProcess:
+                    pass  # Already dead, that's fine
+
+            # Kill main process last
             try:
-                proc = psutil.Process(pid)
-                if proc.is_running():
-                    proc.kill()
+                main_proc = _get_proc(main_pid)
+                _signal_proc(main_proc, signal.SIGTERM)
+                if _wait_for_exit(lambda: _is_alive(main_proc)):
+                    _signal_proc(main_proc, signal.SIGKILL)
+                killed_pids.insert(0, main_pid)
             except psutil.NoSuchProcess:
-                pass  # Already dead, that's fine
-
-        # Kill main process last
-        try:
-            main_proc = psutil.Process(main_pid)
-            main_proc.terminate()
-            time.sleep(0.5)
-            if main_proc.is_running():
-                main_proc.kill()
-            killed_pids.insert(0, main_pid)
-        except psutil.NoSuchProcess:
-            emit('process_killed', {
-                'success': False,
-                'error': 'Main process not found',
-                'pid': main_pid
-            })
-            return
-        except psutil.AccessDenied:
-            emit('process_killed', {
-                'success': False,
-                'error': 'Access denied',
-                'pid': main_pid
-            })
-            return
-
+                emit('process_killed', {
+                    'success': False,
+                    'error': 'Main process not found',
+                    'pid': main_pid
+                })
+                return
+            except psutil.AccessDenied:
+                emit('process_killed', {
+                    'success': False,
+                    'error': 'Access denied',
+                    'pid': main_pid
+                })
+                return
+
+        # Don't let a cached list resurrect the processes on the client's next request
+        _invalidate_snapshots()
         emit('process_group_killed', {
             'success': True,
             'main_pid': main_pid,
@@ -142,51 +582,49 @@ def handle_kill_process_group(data):
         })
 
 
+# Process fields returned by get_process_details; connections and open files are opt-in
+DETAIL_ATTRS = (
+    'name', 'status', 'username', 'cpu_percent', 'memory_percent', 'memory_info',
+    'num_threads', 'create_time', 'exe', 'cwd', 'cmdline',
+)
+
+
 @socketio.on('get_process_details')
 def handle_get_process_details(data):
     """Get detailed info for a specific process"""
     try:
         pid = data.get('pid')
-        proc = psutil.Process(pid)
-
-        # Gather detailed info safely
-        details = {
-            'pid': pid,
-            'name': proc.name(),
-            'status': proc.status(),
-            'username': proc.username(),
-            'cpu_percent': proc.cpu_percent(),
-            'memory_percent': proc.memory_percent(),
-            'memory_info': proc.memory_info()._asdict(),
-            'num_threads': proc.num_threads(),
-            'create_time': proc.create_time()
-        }
-
-        # Try to get additional info, but don't fail if we can't
-        try:
-            details['exe'] = proc.exe()
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            details['exe'] = None
-
-        try:
-            details['cwd'] = proc.cwd()
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            details['cwd'] = None
-
-        try:
-            details['cmdline'] = proc.cmdline()
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            details['cmdline'] = []
-
-        try:
-            details['connections'] = [conn._asdict() for conn in proc.connections()]
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            details['connections'] = []
-
-        try:
-            details['open_files'] = [f._asdict() for f in proc.open_files()]
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            details['open_files'] = []
+        include_connections = data.get('include_connections', False)
+        include_open_files = data.get('include_open_files', False)
+        proc = _get_proc(pid)
+
+        # Use oneshot() context manager so the accessors below share cached /proc reads
+        with proc.oneshot():
+            # Gather detailed info safely: as_dict() fills fields we can't read
+            # with None in one pass instead of a try/except per field
+            details = {'pid': pid, **proc.as_dict(attrs=DETAIL_ATTRS, ad_value=None)}
+            if details['memory_info'] is not None:
+                details['memory_info'] = details['memory_info']._asdict()
+            if details['cmdline'] is None:
+                details['cmdline'] = []
+
+            # Connections and open files walk every fd of the process, so only
+            # fetch them when the client asks for them
+            if include_connections:
+                try:
+                    if USE_PROC_NET_CONNECTIONS:
+                        connections = _connections_for_pid(pid)
+                    else:
+                        connections = proc.connections()
+                    details['connections'] = [conn._asdict() for conn in connections]
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    details['connections'] = []
+
+            if include_open_files:
+                try:
+                    details['open_files'] = [f._asdict() for f in proc.open_files()]
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    details['open_files'] = []
 
         emit('process_details', details)
     except psutil.NoSuchProcess:
@@ -199,7 +637,4 @@ if __name__ == '__main__':
     print("Starting Process Viewer on http://localhost:5555")
     print("Open your browser to view running processes")
 
-    # Initialize CPU monitoring for non-blocking calls
-    psutil.cpu_percent(interval=None)
-
     socketio.run(app, debug=True, port=5555, allow_unsafe_werkzeug=True)
\ No newline at end of file
@@ -2,21 +2,316 @@
 Enhanced process identification and categorization
 """
 import psutil
+import operator
 import os
 import re
+import threading
 import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 
+# Linux: task flag set on kernel threads (PF_KTHREAD in include/linux/sched.h)
+PF_KTHREAD = 0x00200000
+
+# proc(5) field numbers of the /proc/<pid>/stat columns _parse_stat reads:
+# ppid, flags, starttime
+_STAT_COLUMNS = (4, 9, 22)
+
+# Fields after the comm's closing ')' start at field 3, so field N is at index N - 3.
+# Performance: splitting stops right after the last column we need, and a single
+# itemgetter pulls all of them out in one C call
+_STAT_MAXSPLIT = _STAT_COLUMNS[-1] - 2
+_stat_columns = operator.itemgetter(*(col - 3 for col in _STAT_COLUMNS))
+
+# Home directory roots (macOS, Linux); paths under them belong to a user
+USER_PREFIXES = ('/Users/', '/home/')
+
+# Leading alphabetic run of an executable name, so 'python3.12' and 'redis-server'
+# key the describer table as 'python' and 'redis'
+_EXE_TOKEN = re.compile(r'[a-z]+')
+
+# Process fields identify_from_info() reads, fetched in one batch via
+# psutil.process_iter(attrs=...) or Process.as_dict(attrs=...)
+IDENTIFY_ATTRS = ['pid', 'ppid', 'name', 'cmdline', 'cwd', 'cpu_percent', 'memory_percent',
+                  'memory_info', 'status', 'username', 'num_threads', 'create_time']
+
+# Fields fixed for a process's lifetime in practice; fetched once per (pid, create_time)
+# by ProcessIdentifier._stable_fields() rather than on every scan, since username costs
+# a uid -> name lookup. cwd (chdir) and exe (exec) can change, so they are re-read
+_STABLE_ATTRS = ('username',)
+# The IDENTIFY_ATTRS that are re-read on every scan
+_VOLATILE_ATTRS = [attr for attr in IDENTIFY_ATTRS if attr not in _STABLE_ATTRS]
+
+# Fields a process must expose to be listed at all; the rest degrade to empty values
+_REQUIRED_ATTRS = ('name', 'cpu_percent', 'memory_percent', 'memory_info', 'status',
+                   'username', 'num_threads', 'create_time')
+
+
+def _parse_stat(data: bytes) -> Optional[Dict[str, Any]]:
+    """Parse the fields we use out of a raw /proc/<pid>/stat buffer"""
+    # comm can contain spaces and parentheses, so split around the last ')'
+    lparen = data.find(b'(')
+    rparen = data.rfind(b')')
+    if lparen < 0 or rparen < 0:
+        return None
+
+    ppid, flags, starttime = _stat_columns(data[rparen + 2:].split(None, _STAT_MAXSPLIT))
+    return {
+        'comm': data[lparen + 1:rparen].decode(errors='replace'),
+        'ppid': int(ppid),
+        'flags': int(flags),
+        'starttime': int(starttime),
+    }
+
+
+def _fast_proc_snapshot() -> Dict[int, Dict[str, Any]]:
+    """Read /proc/<pid>/stat for every PID with one read per process (Linux only)
+
+    Performance: psutil.process_iter() opens and parses several /proc files per
+    process through separate accessors. Here each PID costs a single open+read,
+    and only the numeric /proc entries are visited.
+    """
+    snapshot = {}
+
+    # Open /proc once and resolve each stat file relative to it (openat), so the
+    # kernel doesn't walk the /proc prefix again for every process
+    proc_fd = os.open('/proc', os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for entry in os.listdir(proc_fd):
+            if not entry.isdigit():
+                continue
+            try:
+                fd = os.open(f'{entry}/stat', os.O_RDONLY, dir_fd=proc_fd)
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                continue  # Process exited or is hidden from us
+            try:
+                data = os.read(fd, 4096)
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
+
+            stat = _parse_stat(data)
+            if stat is not None:
+                snapshot[int(entry)] = stat
+    finally:
+        os.close(proc_fd)
+
+    return snapshot
+
+
+# Working-directory names too generic to label a project with
+_NON_PROJECT_DIRS = frozenset({'Users', 'home', ''})
+# Node working directories that name a build step rather than the project
+_NODE_BUILD_DIRS = frozenset({'node', 'src', 'dist'})
+
+# Command-line keywords _match_describer() falls back on for databases and editors.
+# 'code' also covers 'vscode', and 'vim' covers 'nvim'
+_DATABASE_CMD_REGEX = re.compile(r'postgres|mysql|mongodb|redis')
+_IDE_CMD_REGEX = re.compile(r'code|vim|emacs|sublime|atom')
+
+# Git subcommands named in descriptions, checked in this order
+_GIT_OPERATIONS = ('clone', 'pull', 'push', 'fetch', 'merge', 'rebase', 'commit')
+
+# Folders a user's script path is shown relative to, most preferred first
+_ANCHOR_FOLDERS = ('Documents', 'GitHub', 'Projects')
+_ANCHOR_RANK = {folder: rank for rank, folder in enumerate(_ANCHOR_FOLDERS)}
+
+
+def _relative_to_anchor(path_parts: List[str]) -> Optional[str]:
+    """Join path_parts from the most preferred anchor folder on, or None if none is present
+
+    Performance: a single pass over the parts replaces a membership test and
+    index() call per anchor folder.
+    """
+    best_rank = best_idx = None
+    for idx, part in enumerate(path_parts):
+        rank = _ANCHOR_RANK.get(part)
+        if rank is not None and (best_rank is None or rank < best_rank):
+            best_rank, best_idx = rank, idx
+            if rank == 0:
+                break
+    if best_idx is None:
+        return None
+    return '/'.join(path_parts[best_idx:])
+
+
+# Linux: kernel TCP socket tables; column 3 is the state, where 0A is TCP_LISTEN
+_PROC_NET_TCP_TABLES = ('/proc/net/tcp', '/proc/net/tcp6')
+_TCP_LISTEN = '0A'
+
+
+def _proc_net_listen_map(pids) -> Dict[int, List[int]]:
+    """Map PID -> listening TCP ports from /proc/net/tcp[6] (Linux only)
+
+    Performance: the tables are parsed once for LISTEN rows (inode -> port), and
+    then only the given PIDs' fds are resolved against them, instead of
+    psutil.net_connections() decoding every socket of every process.
+    """
+    inode_ports = {}
+    for path in _PROC_NET_TCP_TABLES:
+        try:
+            with open(path) as table:
+                next(table)  # Header row
+                for line in table:
+                    fields = line.split()
+                    if fields[3] == _TCP_LISTEN:
+                        # local_address is HEXIP:HEXPORT; field 9 is the socket inode
+                        inode_ports[fields[9]] = int(fields[1].rsplit(':', 1)[1], 16)
+        except OSError:
+            continue  # e.g. IPv6 disabled
+
+    listen_map = defaultdict(list)
+    if not inode_ports:
+        return listen_map
+
+    for pid in pids:
+        try:
+            fd_dir = os.open(f'/proc/{pid}/fd', os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue  # Process exited or its fds aren't ours to read
+        try:
+            for fd in os.listdir(fd_dir):
+                try:
+                    target = os.readlink(fd, dir_fd=fd_dir)
+                except OSError:
+                    continue
+                # Socket fds link to 'socket:[<inode>]'
+                if target.startswith('socket:['):
+                    port = inode_ports.get(target[8:-1])
+                    if port is not None:
+                        listen_map[pid].append(port)
+        except OSError:
+            continue
+        finally:
+            os.close(fd_dir)
+
+    return listen_map
+
+
+# Per-process connection scans walk every open fd; processes holding more than this
+# are skipped on that fallback path (the system-wide listen map still covers them)
+MAX_SCAN_FDS = 512
+
+
+def _scan_listening_ports(proc: psutil.Process) -> List[int]:
+    """Listening ports of a single process via proc.connections()
+
+    Fallback for when the system-wide build_listen_map() scan isn't permitted.
+    Performance: fd-heavy processes (databases, browsers) are skipped rather than
+    stalling the refresh on one readlink per descriptor.
+    """
+    if psutil.POSIX and proc.num_fds() > MAX_SCAN_FDS:
+        return []
+    return [conn.laddr.port for conn in proc.connections(kind='inet') if conn.status == 'LISTEN']
+
+
+@dataclass(slots=True)
+class ProcInfo:
+    """An identified process, as listed in the process viewer
+
+    Performance: a slotted record instead of a 20-key dict per process keeps
+    scans of hundreds of processes lighter on memory and attribute lookups.
+    """
+    pid: int
+    name: str
+    cpu_percent: float
+    memory_percent: float
+    memory_mb: float
+    status: str
+    username: str
+    num_threads: int
+    create_time: float
+    listening_ports: List[int]
+    cmdline: List[str]
+    parent_pid: Optional[int]
+    parent_name: Optional[str]
+    description: str
+    app_name: str
+    category: str
+    is_user_process: bool
+    cwd: Optional[str]
+    in_user_directory: bool
+    related_processes: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of every field, for JSON serialization"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class ProcessIdentifier:
     """Identify and describe processes in a user-friendly way"""
 
     def __init__(self, cache_duration=5.0):
-        # Performance: Cache process list to avoid scanning all processes every request
+        # Performance: Cache process list to avoid scanning all processes every request.
+        # Timestamps come from time.monotonic(), so wall-clock adjustments can't stretch
+        # or cut short a cache window
         self.cache_duration = cache_duration  # seconds
-        self._cached_processes = None
-        self._cache_timestamp = 0
+        # Keyed by view: False -> user processes, True -> "show all" processes
+        self._cached_processes: Dict[bool, List[ProcInfo]] = {}
+        self._cache_timestamp: Dict[bool, float] = {}
+        self._cache_lock = threading.Lock()
+
+        # Performance: LRU of process descriptions keyed by (pid, create_time) plus every
+        # input of the classifier. create_time guards against PID reuse; the cap bounds
+        # memory on busy hosts
+        self._desc_cache: OrderedDict = OrderedDict()
+        self._desc_cache_size = 4096
+
+        # Performance: LRU of _STABLE_ATTRS keyed by (pid, create_time), so long-lived
+        # processes pay for the username lookup once rather than on every refresh
+        self._stable_cache: OrderedDict = OrderedDict()
+        self._stable_cache_size = 4096
+
+        # Performance: Quick filter of process names before expensive operations, so
+        # get_user_processes() skips these without identifying them. Substring matches,
+        # compiled into one alternation so each name costs a single regex scan
+        self._excluded_name_regex = re.compile('|'.join(map(re.escape, (
+            'code', 'git', 'vim', 'nvim', 'emacs', 'sublime', 'atom',
+            'code-helper', 'chrome', 'firefox', 'safari', 'slack', 'spotify',
+            'finder', 'dock', 'systemuiserver', 'windowserver',
+        ))))
+        # Executable locations of OS-provided binaries (macOS, Linux), skipped by
+        # get_user_processes() before any further fetch
+        self._system_exe_regex = re.compile(r'/System/|/usr/libexec/|/usr/sbin/')
+        # Recognizable services still listed by the "show all" view despite a System category
+        self._system_app_regex = re.compile(r'docker|postgres|mysql|redis|mongo|elastic')
+        # Process names likely to belong to servers; only these get a port lookup
+        # in get_user_processes()
+        self._server_name_regex = re.compile('|'.join((
+            'python', 'node', 'npm', 'flask', 'django', 'uvicorn',
+            'gunicorn', 'streamlit', 'gradio', 'vite', 'webpack',
+        )))
+
+        # Performance: Listing filters as frozensets, built once instead of a list
+        # literal per process. Categories and app names hidden from both views
+        self._hidden_categories = frozenset({'System', 'User Process', 'Development IDE'})
+        self._hidden_app_names = frozenset({'code', 'git', 'vim', 'nvim', 'emacs', 'sublime', 'atom'})
+
+        # Performance: Keyword groups for _find_related_processes, each compiled into a
+        # single alternation so one C-level scan replaces a chain of substring tests
+        self._rel_patterns = {
+            'venv': re.compile(r'virtualenv|pipenv'),
+            'npm_script': re.compile(r'run|dev'),
+            'node_pm': re.compile(r'yarn|pnpm'),
+            'bundler': re.compile(r'webpack|vite|esbuild'),
+            'worker': re.compile(r'worker|celery|rq|huey'),
+            'web_worker': re.compile(r'gunicorn|uvicorn'),
+        }
+
+        # (timestamp, procs, ppid_map) of the last process table walk, shared by both views
+        self._walk: Optional[tuple] = None
+        # PID -> Process from the last walk, for cached_process()
+        self._procs_by_pid: Dict[int, psutil.Process] = {}
+
+        # Linux: PID -> (starttime, Process) kept between process table walks
+        self._proc_cache: Dict[int, tuple] = {}
+
+        # cwd -> (basename, parent basename), reset at the start of each scan
+        self._path_cache: Dict[str, tuple] = {}
 
         # Known development tools and their descriptions
         self.known_apps = {
@@ -55,520 +350,650 @@ class ProcessIdentifier:
             'nvim': 'Neovim Text Editor',
             'emacs': 'Emacs Text Editor',
         }
+        # Performance: Classifier dispatch keyed by executable name (see _EXE_TOKEN)
+        self._describers = {
+            'python': self._describe_python,
+            'pythonw': self._describe_python,
+            'ipython': self._describe_python,
+            'node': self._describe_node,
+            'nodejs': self._describe_node,
+            'ruby': self._describe_ruby,
+            'docker': self._describe_docker,
+            'git': self._describe_git,
+            'postgres': self._describe_database,
+            'mysqld': self._describe_database,
+            'mysql': self._describe_database,
+            'mongod': self._describe_database,
+            'mongodb': self._describe_database,
+            'redis': self._describe_database,
+            'code': self._describe_ide,
+            'vim': self._describe_ide,
+            'nvim': self._describe_ide,
+            'emacs': self._describe_ide,
+        }
+
+        # Performance: One compiled alternation finds a known app in a single C-level
+        # scan. Longest keys go first so e.g. 'nvim' and 'pnpm' win over 'vim' and 'npm'
+        self._app_regex = re.compile('|'.join(
+            re.escape(app) for app in sorted(self.known_apps, key=len, reverse=True)
+        ))
+        # (description, display name) per known app, so a match needs no .title() call
+        self._known_apps_titled = {app: (desc, app.title()) for app, desc in self.known_apps.items()}
+
+        # Performance: Build the set of browser-facing ports once so classifying a
+        # listening port is a single hash lookup instead of rebuilding lists per socket
+        common_web_ports = frozenset({
+            80, 443,  # Standard HTTP/HTTPS
+            3000, 3001, 3002, 3003, 3004, 3005,  # React/Node common ports
+            4000, 4001, 4200,  # Angular, Phoenix
+            5000, 5001, 5173, 5174, 5555, 5556,  # Flask, Vite, custom
+            8000, 8001, 8080, 8081, 8888,  # Django, general web
+            8501, 8502, 8503,  # Streamlit
+            9000, 9001, 9090,  # Various frameworks
+            7860, 7861,  # Gradio
+        })
+        # Also include ports in these ranges that are likely web servers
+        common_web_ranges = frozenset().union(
+            range(3000, 3011), range(4000, 4011), range(5000, 5011), range(7860, 7871),
+            range(8000, 8101), range(8500, 8511), range(9000, 9101),
+        )
+        # But exclude known internal/API ports that aren't meant for browser access
+        exclude_ports = frozenset({
+            # Common internal API ports that tools use
+            49152, 49153, 49154, 49155, 49156, 49157, 49158, 49159,  # Dynamic/private ports
+            49546, 49547, 49548, 49549, 49550, 49551, 49552,  # More dynamic ports
+            49571, 49566, 49565, 49562,  # VS Code internal ports
+            # Add more as needed
+        }).union(range(49000, 65536))  # Ephemeral port range
+        self._web_ports = common_web_ports | (common_web_ranges - exclude_ports)
+
+        # Performance: Shells, editors and CLI tools never bind a TCP listener, so
+        # identify_from_info() skips the port lookup for them entirely
+        self._nonlistening_names = frozenset({
+            'sh', 'bash', 'zsh', 'fish', 'dash', 'tcsh', 'login',
+            'vim', 'nvim', 'emacs', 'nano', 'less', 'more', 'man',
+            'git', 'code', 'tmux', 'screen', 'top', 'htop', 'sleep', 'tail',
+        })
+
+    def build_listen_map(self, procs=()) -> Dict[int, List[int]]:
+        """Map PID -> listening ports from a single system-wide connection scan
+
+        Performance: one scan replaces a proc.connections() walk per process. On
+        Linux the TCP tables are read straight from /proc and only the fds of procs
+        (the processes the caller will list) are resolved. Elsewhere one
+        psutil.net_connections() call is used; where that isn't permitted (e.g.
+        macOS without root), procs are scanned one at a time instead.
+        """
+        # A process that never listens doesn't need its sockets resolved
+        procs = [proc for proc in procs
+                 if proc.info['name'] and proc.info['name'].lower() not in self._nonlistening_names]
+
+        if psutil.LINUX:
+            return _proc_net_listen_map(proc.pid for proc in procs)
+
+        listen_map = defaultdict(list)
+        try:
+            for conn in psutil.net_connections(kind='inet'):
+                if conn.status == 'LISTEN' and conn.pid is not None:
+                    listen_map[conn.pid].append(conn.laddr.port)
+        except psutil.AccessDenied:
+            for proc in procs:
+                try:
+                    ports = _scan_listening_ports(proc)
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    continue
+                if ports:
+                    listen_map[proc.pid] = ports
+        return listen_map
 
-    def identify_process(self, proc: psutil.Process, check_ports=True) -> Dict[str, Any]:
+    def identify_process(self, proc: psutil.Process, check_ports=True,
+                         listen_map: Optional[Dict[int, List[int]]] = None,
+                         ppid_map: Optional[Dict[int, tuple]] = None) -> Optional[ProcInfo]:
         """Get enhanced information about a process
 
         Args:
             proc: Process to identify
             check_ports: If False, skip expensive port scanning (default: True)
+            listen_map: Optional PID -> listening ports map from build_listen_map();
+                when given, it is used instead of scanning this process's connections
+            ppid_map: Optional PID -> (ppid, name) map, as the scans build from their walk;
+                when given, the parent is looked up there instead of via proc.parent()
         """
         try:
-            # Use oneshot() context manager for better performance
-            with proc.oneshot():
-                base_info = {
-                    'pid': proc.pid,
-                    'name': proc.name(),
-                    'cpu_percent': proc.cpu_percent(),
-                    'memory_percent': proc.memory_percent(),
-                    'memory_mb': proc.memory_info().rss / 1024 / 1024,
-                    'status': proc.status(),
-                    'username': proc.username(),
-                    'num_threads': proc.num_threads(),
-                    'create_time': proc.create_time()
-                }
-
-            # Get listening ports for this process (can be expensive - make it optional)
-            if check_ports:
+            info = self._fetch_info(proc)
+
+            # Without shared maps, fall back to per-process lookups for ports and parent
+            if (check_ports and listen_map is None and info['name']
+                    and info['name'].lower() not in self._nonlistening_names):
                 try:
-                    connections = proc.connections(kind='inet')
-                    listening_ports = []
-                    for conn in connections:
-                        if conn.status == 'LISTEN':
-                            port = conn.laddr.port
-                            # Filter to only common web/app ports, exclude internal API ports
-                            # Common web development port ranges
-                            common_web_ports = [
-                                80, 443,  # Standard HTTP/HTTPS
-                                3000, 3001, 3002, 3003, 3004, 3005,  # React/Node common ports
-                                4000, 4001, 4200,  # Angular, Phoenix
-                                5000, 5001, 5173, 5174, 5555, 5556,  # Flask, Vite, custom
-                                8000, 8001, 8080, 8081, 8888,  # Django, general web
-                                8501, 8502, 8503,  # Streamlit
-                                9000, 9001, 9090,  # Various frameworks
-                                7860, 7861,  # Gradio
-                            ]
-
-                            # Include if it's a known web port or in common ranges
-                            if port in common_web_ports:
-                                listening_ports.append(port)
-                            # Also include ports in these ranges that are likely web servers
-                            elif (3000 <= port <= 3010) or (4000 <= port <= 4010) or \
-                                 (5000 <= port <= 5010) or (7860 <= port <= 7870) or \
-                                 (8000 <= port <= 8100) or (8500 <= port <= 8510) or \
-                                 (9000 <= port <= 9100):
-                                # But exclude known internal/API ports that aren't meant for browser access
-                                exclude_ports = {
-                                    # Common internal API ports that tools use
-                                    49152, 49153, 49154, 49155, 49156, 49157, 49158, 49159,  # Dynamic/private ports
-                                    49546, 49547, 49548, 49549, 49550, 49551, 49552,  # More dynamic ports
-                                    49571, 49566, 49565, 49562,  # VS Code internal ports
-                                    # Add more as needed
-                                }
-                                if port not in exclude_ports and not (49000 <= port <= 65535):  # Exclude ephemeral port range
-                                    listening_ports.append(port)
-
-                    # For the chat-explorer case, prioritize lower port numbers (usually the main server)
-                    listening_ports = list(set(listening_ports))  # Remove duplicates
-                    listening_ports.sort()  # Sort so main ports appear first
-
-                    base_info['listening_ports'] = listening_ports
+                    listen_map = {proc.pid: _scan_listening_ports(proc)}
                 except (psutil.AccessDenied, psutil.NoSuchProcess):
-                    base_info['listening_ports'] = []
-            else:
-                # If skipping port check, set empty list
-                base_info['listening_ports'] = []
+                    listen_map = {}
+            if ppid_map is None:
+                try:
+                    parent = proc.parent()
+                    ppid_map = {parent.pid: (None, parent.name())} if parent else {}
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    ppid_map = {}
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
 
-            # Get command line for better identification
-            try:
-                cmdline = proc.cmdline()
-                base_info['cmdline'] = cmdline
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                cmdline = []
-                base_info['cmdline'] = []
+        return self.identify_from_info(info, check_ports, listen_map, ppid_map)
 
-            # Get parent process info for context
-            try:
-                parent = proc.parent()
-                if parent:
-                    base_info['parent_pid'] = parent.pid
-                    base_info['parent_name'] = parent.name()
-                else:
-                    base_info['parent_pid'] = None
-                    base_info['parent_name'] = None
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                base_info['parent_pid'] = None
-                base_info['parent_name'] = None
-
-            # Get enhanced description
-            description = self._get_process_description(proc, cmdline)
-            base_info['description'] = description['description']
-            base_info['app_name'] = description['app_name']
-            base_info['category'] = description['category']
-            base_info['is_user_process'] = description['is_user_process']
-
-            # Get working directory for context
-            try:
-                cwd = proc.cwd()
-                base_info['cwd'] = cwd
-                # Check if it's in a user directory
-                if cwd and ('/Users/' in cwd or '/home/' in cwd):
-                    base_info['in_user_directory'] = True
-                else:
-                    base_info['in_user_directory'] = False
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                base_info['cwd'] = None
-                base_info['in_user_directory'] = False
+    def identify_from_info(self, info: Dict[str, Any], check_ports=True,
+                           listen_map: Optional[Dict[int, List[int]]] = None,
+                           ppid_map: Optional[Dict[int, tuple]] = None) -> Optional[ProcInfo]:
+        """Get enhanced information about a process from pre-fetched fields
 
-            return base_info
+        Performance: info is a _fetch_info() result, so all per-process fields arrive
+        in one batched fetch instead of a getter call each.
 
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        Args:
+            info: Process fields keyed by IDENTIFY_ATTRS (inaccessible fields as None)
+            check_ports: If False, skip port lookup (default: True)
+            listen_map: PID -> listening ports map from build_listen_map(); without it
+                no ports are reported
+            ppid_map: PID -> (ppid, name) map used to name the parent process
+        """
+        # Processes whose basic fields were denied are skipped, as with a failed oneshot()
+        if any(info[attr] is None for attr in _REQUIRED_ATTRS):
             return None
 
-    def _get_process_description(self, proc: psutil.Process, cmdline: List[str]) -> Dict[str, str]:
+        pid = info['pid']
+        name = info['name']
+
+        # Get listening ports for this process (can be expensive - make it optional)
+        listening_ports = []
+        if check_ports and listen_map is not None and name.lower() not in self._nonlistening_names:
+            ports = listen_map.get(pid)
+            if ports:
+                # Filter to only common web/app ports, exclude internal API ports.
+                # Performance: one set intersection filters and dedupes in C
+                # (IPv4 and IPv6 listeners on the same port collapse to one).
+                # For the chat-explorer case, prioritize lower port numbers (usually the main server)
+                listening_ports = sorted(self._web_ports.intersection(ports))
+
+        # Get command line for better identification
+        cmdline = info['cmdline'] or []
+
+        # Get parent process info for context
+        ppid = info['ppid']
+        parent_entry = ppid_map.get(ppid) if ppid and ppid_map else None
+
+        # Get working directory for context
+        cwd = info['cwd']
+
+        # Get enhanced description
+        description = self._get_process_description(pid, info['create_time'], name, cmdline, cwd)
+
+        return ProcInfo(
+            pid=pid,
+            name=name,
+            cpu_percent=info['cpu_percent'],
+            memory_percent=info['memory_percent'],
+            memory_mb=info['memory_info'].rss / 1048576,
+            status=info['status'],
+            username=info['username'],
+            num_threads=info['num_threads'],
+            create_time=info['create_time'],
+            listening_ports=listening_ports,
+            cmdline=cmdline,
+            parent_pid=ppid if parent_entry else None,
+            parent_name=parent_entry[1] if parent_entry else None,
+            description=description['description'],
+            app_name=description['app_name'],
+            category=description['category'],
+            is_user_process=description['is_user_process'],
+            cwd=cwd,
+            # Check if it's in a user directory
+            in_user_directory=bool(cwd and cwd.startswith(USER_PREFIXES)),
+        )
+
+    def _stable_fields(self, proc: psutil.Process) -> Dict[str, Any]:
+        """username of proc (None where denied), cached for its lifetime
+
+        create_time is memoized on the Process by the batched fetch in _fetch_info(),
+        so the cache key costs no syscall, and it tells a recycled PID apart from the
+        process it replaced.
+        """
+        key = (proc.pid, proc.create_time())
+        cache = self._stable_cache
+        fields = cache.get(key)
+        if fields is not None:
+            cache.move_to_end(key)
+            return fields
+
+        fields = proc.as_dict(attrs=_STABLE_ATTRS, ad_value=None)
+        cache[key] = fields
+        if len(cache) > self._stable_cache_size:
+            cache.popitem(last=False)
+        return fields
+
+    def _fetch_info(self, proc: psutil.Process) -> Dict[str, Any]:
+        """Batched IDENTIFY_ATTRS fetch for proc, with the stable fields served from cache"""
+        info = proc.as_dict(attrs=_VOLATILE_ATTRS, ad_value=None)
+        info.update(self._stable_fields(proc))
+        return info
+
+    def _get_process_description(self, pid: int, create_time: float, name: str,
+                                 cmdline: List[str], cwd: Optional[str]) -> Dict[str, str]:
+        """Generate a user-friendly description of the process, reusing cached results"""
+        # Performance: the description depends only on name, cmdline and cwd, so a
+        # long-lived process skips the whole classifier until one of them changes
+        key = (pid, create_time, name, cwd, tuple(cmdline))
+        cache = self._desc_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+
+        result = self._compute_process_description(name, cmdline, cwd)
+        cache[key] = result
+        if len(cache) > self._desc_cache_size:
+            cache.popitem(last=False)
+        return result
+
+    def _compute_process_description(self, proc_name: str, cmdline: List[str],
+                                     cwd: Optional[str]) -> Dict[str, str]:
         """Generate a user-friendly description of the process"""
         result = {
-            'description': proc.name(),
-            'app_name': proc.name(),
+            'description': proc_name,
+            'app_name': proc_name,
             'category': 'System',
             'is_user_process': False
         }
 
-        proc_name_lower = proc.name().lower()
+        proc_name_lower = proc_name.lower()
 
         # Check if it's a known application
-        for app, desc in self.known_apps.items():
-            if app in proc_name_lower:
-                result['description'] = desc
-                result['app_name'] = app.title()
-                result['category'] = 'Development Tool'
-                result['is_user_process'] = True
-                return result
+        match = self._app_regex.search(proc_name_lower)
+        if match:
+            result['description'], result['app_name'] = self._known_apps_titled[match.group(0)]
+            result['category'] = 'Development Tool'
+            result['is_user_process'] = True
+            return result
 
         # Analyze command line for better identification
         if cmdline and len(cmdline) > 0:
             cmd = ' '.join(cmdline)
+            # Performance: Lowercase the joined command line once rather than per check
+            cmd_lower = cmd.lower()
+
+            # Performance: Pick the classifier from the executable name with one dict
+            # lookup; only unrecognised executables fall back to substring probing
+            exe_token = _EXE_TOKEN.match(os.path.basename(cmdline[0]).lower())
+            describe = self._describers.get(exe_token.group(0)) if exe_token else None
+            if describe is None:
+                describe = self._match_describer(proc_name_lower, cmd_lower)
+            if describe is not None:
+                describe(cmdline, cmd, cmd_lower, cwd, result)
 
-            # Python processes
-            if 'python' in proc_name_lower or 'python' in cmd.lower():
-                result['category'] = 'Python Application'
-                result['is_user_process'] = True
-
-                # Look for the actual script name
-                for arg in cmdline:
-                    if arg.endswith('.py'):
-                        script_path = arg
-                        script_name = os.path.basename(arg).replace('.py', '')
-                        result['app_name'] = script_name
-
-                        # Get the directory context for better identification
-                        try:
-                            cwd = proc.cwd()
-                            # Extract project/folder name from working directory
-                            if cwd:
-                                project_name = os.path.basename(cwd)
-                                if project_name and project_name != script_name:
-                                    context = f" ({project_name})"
-                                else:
-                                    # Try parent directory
-                                    parent_dir = os.path.basename(os.path.dirname(cwd))
-                                    if parent_dir and parent_dir not in ['Users', 'home', '']:
-                                        context = f" ({parent_dir})"
-                                    else:
-                                        context = ""
-                            else:
-                                context = ""
-                        except Exception:
-                            context = ""
+        # Check if it's a user process based on location
+        if cwd and cwd.startswith(USER_PREFIXES):
+            result['is_user_process'] = True
+            if result['category'] == 'System':
+                result['category'] = 'User Process'
 
-                        # Special cases with context
-                        if 'app.py' in arg:
-                            result['description'] = f"Flask/Web App: {script_name}{context}"
-                        elif 'manage.py' in arg:
-                            result['description'] = f"Django App: {script_name}{context}"
-                        elif 'setup.py' in arg:
-                            result['description'] = f"Python Setup: {script_name}{context}"
-                        elif 'server' in script_name.lower():
-                            result['description'] = f"Python Server: {script_name}{context}"
-                        elif 'api' in script_name.lower():
-                            result['description'] = f"API Server: {script_name}{context}"
-                        elif 'main' in script_name.lower():
-                            result['description'] = f"Main App: {script_name}{context}"
-                        elif 'test' in script_name.lower():
-                            result['description'] = f"Test Runner: {script_name}{context}"
-                        elif 'worker' in script_name.lower():
-                            result['description'] = f"Worker Process: {script_name}{context}"
-                        else:
-                            # Include full path if it's in a meaningful location
-                            if '/Users/' in script_path or '/home/' in script_path:
-                                # Get relative path from user directory
-                                path_parts = script_path.split('/')
-                                if 'Documents' in path_parts:
-                                    idx = path_parts.index('Documents')
-                                    relative_path = '/'.join(path_parts[idx:])
-                                    result['description'] = f"Python: {relative_path}"
-                                elif 'GitHub' in path_parts:
-                                    idx = path_parts.index('GitHub')
-                                    relative_path = '/'.join(path_parts[idx:])
-                                    result['description'] = f"Python: {relative_path}"
-                                elif 'Projects' in path_parts:
-                                    idx = path_parts.index('Projects')
-                                    relative_path = '/'.join(path_parts[idx:])
-                                    result['description'] = f"Python: {relative_path}"
-                                else:
-                                    result['description'] = f"Python: {script_name}{context}"
-                            else:
-                                result['description'] = f"Python: {script_name}{context}"
-                        break
-
-                # Check for module execution
-                if '-m' in cmdline:
-                    try:
-                        idx = cmdline.index('-m')
-                        if idx + 1 < len(cmdline):
-                            module = cmdline[idx + 1]
-                            result['app_name'] = module
-
-                            # Get context from working directory
-                            try:
-                                cwd = proc.cwd()
-                                if cwd:
-                                    project = os.path.basename(cwd)
-                                    if project and project not in ['Users', 'home', '']:
-                                        context = f" in {project}"
-                                    else:
-                                        context = ""
-                                else:
-                                    context = ""
-                            except Exception:
-                                context = ""
-
-                            # Common Python modules with better descriptions
-                            if module == 'http.server':
-                                result['description'] = f"Python HTTP Server{context}"
-                            elif module == 'flask':
-                                result['description'] = f"Flask Dev Server{context}"
-                            elif module == 'django':
-                                result['description'] = f"Django Server{context}"
-                            elif module == 'pytest':
-                                result['description'] = f"PyTest Runner{context}"
-                            elif module == 'unittest':
-                                result['description'] = f"Unit Tests{context}"
-                            elif module == 'pip':
-                                result['description'] = f"Pip Package Manager{context}"
-                            elif module == 'venv':
-                                result['description'] = f"Virtual Environment{context}"
-                            elif module == 'jupyter':
-                                result['description'] = f"Jupyter Notebook{context}"
-                            elif module == 'ipython':
-                                result['description'] = f"IPython Shell{context}"
-                            else:
-                                result['description'] = f"Python Module: {module}{context}"
-                    except (ValueError, IndexError):
-                        pass
+        return result
 
-                # Check for Streamlit specifically
-                if 'streamlit' in cmd.lower():
-                    result['app_name'] = 'Streamlit'
-                    result['category'] = 'Python Application'
-                    # Find the script name
-                    for arg in cmdline:
-                        if arg.endswith('.py') and 'streamlit' not in arg.lower():
-                            script = os.path.basename(arg).replace('.py', '')
-                            result['description'] = f"Streamlit App: {script}"
-                            break
+    def _split_cwd(self, cwd: str) -> tuple:
+        """Split a working directory into (basename, parent basename), memoized per scan"""
+        parts = self._path_cache.get(cwd)
+        if parts is None:
+            parts = (os.path.basename(cwd), os.path.basename(os.path.dirname(cwd)))
+            self._path_cache[cwd] = parts
+        return parts
+
+    def _match_describer(self, proc_name_lower: str, cmd_lower: str):
+        """Fallback classifier for executables missing from the dispatch table"""
+        if 'python' in proc_name_lower or 'python' in cmd_lower:
+            return self._describe_python
+        if 'node' in proc_name_lower or 'node' in cmd_lower:
+            return self._describe_node
+        if 'ruby' in proc_name_lower or 'ruby' in cmd_lower:
+            return self._describe_ruby
+        if 'docker' in cmd_lower:
+            return self._describe_docker
+        if 'git' in cmd_lower:
+            return self._describe_git
+        if _DATABASE_CMD_REGEX.search(cmd_lower):
+            return self._describe_database
+        if _IDE_CMD_REGEX.search(cmd_lower):
+            return self._describe_ide
+        return None
+
+    def _describe_python(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                         cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe a Python interpreter process"""
+        result['category'] = 'Python Application'
+        result['is_user_process'] = True
+
+        # Look for the actual script name
+        for arg in cmdline:
+            if arg.endswith('.py'):
+                script_path = arg
+                script_name = os.path.basename(arg).replace('.py', '')
+                result['app_name'] = script_name
+                script_lower = script_name.lower()
+
+                # Get the directory context for better identification
+                # Extract project/folder name from working directory
+                if cwd:
+                    project_name, parent_dir = self._split_cwd(cwd)
+                    if project_name and project_name != script_name:
+                        context = f" ({project_name})"
                     else:
-                        result['description'] = "Streamlit Application"
+                        # Try parent directory
+                        if parent_dir and parent_dir not in _NON_PROJECT_DIRS:
+                            context = f" ({parent_dir})"
+                        else:
+                            context = ""
+                else:
+                    context = ""
 
-                # Check for virtual environment
-                if '.venv' in cmd or 'virtualenv' in cmd or 'pipenv' in cmd:
-                    result['description'] += " (Virtual Environment)"
+                # Special cases with context
+                if 'app.py' in arg:
+                    result['description'] = f"Flask/Web App: {script_name}{context}"
+                elif 'manage.py' in arg:
+                    result['description'] = f"Django App: {script_name}{context}"
+                elif 'setup.py' in arg:
+                    result['description'] = f"Python Setup: {script_name}{context}"
+                elif 'server' in script_lower:
+                    result['description'] = f"Python Server: {script_name}{context}"
+                elif 'api' in script_lower:
+                    result['description'] = f"API Server: {script_name}{context}"
+                elif 'main' in script_lower:
+                    result['description'] = f"Main App: {script_name}{context}"
+                elif 'test' in script_lower:
+                    result['description'] = f"Test Runner: {script_name}{context}"
+                elif 'worker' in script_lower:
+                    result['description'] = f"Worker Process: {script_name}{context}"
+                else:
+                    # Include full path if it's in a meaningful location
+                    if script_path.startswith(USER_PREFIXES):
+                        # Get relative path from user directory
+                        relative_path = _relative_to_anchor(script_path.split('/'))
+                        if relative_path:
+                            result['description'] = f"Python: {relative_path}"
+                        else:
+                            result['description'] = f"Python: {script_name}{context}"
+                    else:
+                        result['description'] = f"Python: {script_name}{context}"
+                break
 
-            # Node.js processes
-            elif 'node' in proc_name_lower or 'node' in cmd.lower():
-                result['category'] = 'Node.js Application'
-                result['is_user_process'] = True
+        # Check for module execution
+        if '-m' in cmdline:
+            try:
+                idx = cmdline.index('-m')
+                if idx + 1 < len(cmdline):
+                    module = cmdline[idx + 1]
+                    result['app_name'] = module
 
-                # Get working directory context
-                try:
-                    cwd = proc.cwd()
+                    # Get context from working directory
                     if cwd:
-                        project_name = os.path.basename(cwd)
-                        if not project_name or project_name in ['node', 'src', 'dist']:
-                            project_name = os.path.basename(os.path.dirname(cwd))
-                        context = f" ({project_name})" if project_name and project_name not in ['Users', 'home', ''] else ""
+                        project = self._split_cwd(cwd)[0]
+                        if project and project not in _NON_PROJECT_DIRS:
+                            context = f" in {project}"
+                        else:
+                            context = ""
                     else:
                         context = ""
-                except Exception:
-                    context = ""
 
-                for arg in cmdline:
-                    if arg.endswith('.js') or arg.endswith('.ts'):
-                        script_path = arg
-                        script_name = os.path.basename(arg).replace('.js', '').replace('.ts', '')
-                        result['app_name'] = script_name
-
-                        # Special cases with context
-                        if 'server' in script_name.lower():
-                            result['description'] = f"Node Server: {script_name}{context}"
-                        elif 'index' in script_name.lower():
-                            result['description'] = f"Node App: {script_name}{context}"
-                        elif 'api' in script_name.lower():
-                            result['description'] = f"Node API: {script_name}{context}"
-                        elif 'worker' in script_name.lower():
-                            result['description'] = f"Node Worker: {script_name}{context}"
-                        else:
-                            # Include path context
-                            if '/Users/' in script_path or '/home/' in script_path:
-                                path_parts = script_path.split('/')
-                                if 'node_modules' in path_parts:
-                                    # It's a package being run
-                                    result['description'] = f"Node Package: {script_name}{context}"
-                                elif any(folder in path_parts for folder in ['Documents', 'GitHub', 'Projects']):
-                                    # Show relative path from known folder
-                                    for folder in ['Documents', 'GitHub', 'Projects']:
-                                        if folder in path_parts:
-                                            idx = path_parts.index(folder)
-                                            relative_path = '/'.join(path_parts[idx:])
-                                            result['description'] = f"Node: {relative_path}"
-                                            break
-                                else:
-                                    result['description'] = f"Node: {script_name}{context}"
-                            else:
-                                result['description'] = f"Node: {script_name}{context}"
-                        break
-
-                # Check for npm scripts
-                if 'npm' in cmd and 'run' in cmd:
-                    parts = cmd.split('run')
-                    if len(parts) > 1:
-                        script = parts[1].strip().split()[0] if parts[1].strip() else ''
-                        if script:
-                            result['app_name'] = f"npm:{script}"
-                            result['description'] = f"NPM Script: {script}"
-
-            # Ruby processes
-            elif 'ruby' in proc_name_lower or 'ruby' in cmd.lower():
-                result['category'] = 'Ruby Application'
-                result['is_user_process'] = True
-
-                if 'rails' in cmd:
-                    result['app_name'] = 'Rails Server'
-                    result['description'] = 'Ruby on Rails Application'
-                elif 'bundle' in cmd:
-                    result['app_name'] = 'Bundler'
-                    result['description'] = 'Ruby Bundler Process'
+                    # Common Python modules with better descriptions
+                    if module == 'http.server':
+                        result['description'] = f"Python HTTP Server{context}"
+                    elif module == 'flask':
+                        result['description'] = f"Flask Dev Server{context}"
+                    elif module == 'django':
+                        result['description'] = f"Django Server{context}"
+                    elif module == 'pytest':
+                        result['description'] = f"PyTest Runner{context}"
+                    elif module == 'unittest':
+                        result['description'] = f"Unit Tests{context}"
+                    elif module == 'pip':
+                        result['description'] = f"Pip Package Manager{context}"
+                    elif module == 'venv':
+                        result['description'] = f"Virtual Environment{context}"
+                    elif module == 'jupyter':
+                        result['description'] = f"Jupyter Notebook{context}"
+                    elif module == 'ipython':
+                        result['description'] = f"IPython Shell{context}"
+                    else:
+                        result['description'] = f"Python Module: {module}{context}"
+            except (ValueError, IndexError):
+                pass
+
+        # Check for Streamlit specifically
+        if 'streamlit' in cmd_lower:
+            result['app_name'] = 'Streamlit'
+            result['category'] = 'Python Application'
+            # Find the script name
+            for arg in cmdline:
+                if arg.endswith('.py') and 'streamlit' not in arg.lower():
+                    script = os.path.basename(arg).replace('.py', '')
+                    result['description'] = f"Streamlit App: {script}"
+                    break
+            else:
+                result['description'] = "Streamlit Application"
+
+        # Check for virtual environment
+        if '.venv' in cmd or 'virtualenv' in cmd or 'pipenv' in cmd:
+            result['description'] += " (Virtual Environment)"
+
+    def _describe_node(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                       cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe a Node.js process"""
+        result['category'] = 'Node.js Application'
+        result['is_user_process'] = True
+
+        # Get working directory context
+        if cwd:
+            project_name, parent_dir = self._split_cwd(cwd)
+            if not project_name or project_name in _NODE_BUILD_DIRS:
+                project_name = parent_dir
+            context = f" ({project_name})" if project_name and project_name not in _NON_PROJECT_DIRS else ""
+        else:
+            context = ""
+
+        for arg in cmdline:
+            if arg.endswith('.js') or arg.endswith('.ts'):
+                script_path = arg
+                script_name = os.path.basename(arg).replace('.js', '').replace('.ts', '')
+                result['app_name'] = script_name
+                script_lower = script_name.lower()
+
+                # Special cases with context
+                if 'server' in script_lower:
+                    result['description'] = f"Node Server: {script_name}{context}"
+                elif 'index' in script_lower:
+                    result['description'] = f"Node App: {script_name}{context}"
+                elif 'api' in script_lower:
+                    result['description'] = f"Node API: {script_name}{context}"
+                elif 'worker' in script_lower:
+                    result['description'] = f"Node Worker: {script_name}{context}"
                 else:
-                    for arg in cmdline:
-                        if arg.endswith('.rb'):
-                            script_name = os.path.basename(arg).replace('.rb', '')
-                            result['app_name'] = script_name
-                            result['description'] = f"Ruby Script: {script_name}"
+                    # Include path context
+                    if script_path.startswith(USER_PREFIXES):
+                        path_parts = script_path.split('/')
+                        relative_path = _relative_to_anchor(path_parts)
+                        if 'node_modules' in path_parts:
+                            # It's a package being run
+                            result['description'] = f"Node Package: {script_name}{context}"
+                        elif relative_path:
+                            # Show relative path from known folder
+                            result['description'] = f"Node: {relative_path}"
+                        else:
+                            result['description'] = f"Node: {script_name}{context}"
+                    else:
+                        result['description'] = f"Node: {script_name}{context}"
+                break
+
+        # Check for npm scripts
+        if 'npm' in cmd and 'run' in cmd:
+            parts = cmd.split('run')
+            if len(parts) > 1:
+                script = parts[1].strip().split()[0] if parts[1].strip() else ''
+                if script:
+                    result['app_name'] = f"npm:{script}"
+                    result['description'] = f"NPM Script: {script}"
+
+    def _describe_ruby(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                       cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe a Ruby process"""
+        result['category'] = 'Ruby Application'
+        result['is_user_process'] = True
+
+        if 'rails' in cmd:
+            result['app_name'] = 'Rails Server'
+            result['description'] = 'Ruby on Rails Application'
+        elif 'bundle' in cmd:
+            result['app_name'] = 'Bundler'
+            result['description'] = 'Ruby Bundler Process'
+        else:
+            for arg in cmdline:
+                if arg.endswith('.rb'):
+                    script_name = os.path.basename(arg).replace('.rb', '')
+                    result['app_name'] = script_name
+                    result['description'] = f"Ruby Script: {script_name}"
+                    break
+
+    def _describe_docker(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                         cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe a Docker CLI process"""
+        result['category'] = 'Container'
+        result['is_user_process'] = True
+        result['app_name'] = 'Docker'
+
+        if 'run' in cmd:
+            # Try to extract container image name
+            parts = cmd.split()
+            for i, part in enumerate(parts):
+                if part == 'run' and i + 1 < len(parts):
+                    for j in range(i + 1, len(parts)):
+                        if not parts[j].startswith('-'):
+                            image = parts[j].split('/')[-1].split(':')[0]
+                            result['app_name'] = f"Docker: {image}"
+                            result['description'] = f"Docker Container: {image}"
                             break
 
-            # Docker containers
-            elif 'docker' in cmd.lower():
-                result['category'] = 'Container'
-                result['is_user_process'] = True
-                result['app_name'] = 'Docker'
-
-                if 'run' in cmd:
-                    # Try to extract container image name
-                    parts = cmd.split()
-                    for i, part in enumerate(parts):
-                        if part == 'run' and i + 1 < len(parts):
-                            for j in range(i + 1, len(parts)):
-                                if not parts[j].startswith('-'):
-                                    image = parts[j].split('/')[-1].split(':')[0]
-                                    result['app_name'] = f"Docker: {image}"
-                                    result['description'] = f"Docker Container: {image}"
-                                    break
-
-            # Git operations
-            elif 'git' in cmd.lower():
-                result['category'] = 'Version Control'
-                result['is_user_process'] = True
-                result['app_name'] = 'Git'
-
-                # Identify git operation
-                operations = ['clone', 'pull', 'push', 'fetch', 'merge', 'rebase', 'commit']
-                for op in operations:
-                    if op in cmd:
-                        result['description'] = f"Git: {op} operation"
-                        break
-                else:
-                    result['description'] = 'Git Operation'
-
-            # Database processes
-            elif any(db in cmd.lower() for db in ['postgres', 'mysql', 'mongodb', 'redis']):
-                result['category'] = 'Database'
-                result['is_user_process'] = True
-
-                if 'postgres' in cmd.lower():
-                    result['app_name'] = 'PostgreSQL'
-                    result['description'] = 'PostgreSQL Database Process'
-                elif 'mysql' in cmd.lower():
-                    result['app_name'] = 'MySQL'
-                    result['description'] = 'MySQL Database Process'
-                elif 'mongodb' in cmd.lower() or 'mongod' in cmd.lower():
-                    result['app_name'] = 'MongoDB'
-                    result['description'] = 'MongoDB Database Process'
-                elif 'redis' in cmd.lower():
-                    result['app_name'] = 'Redis'
-                    result['description'] = 'Redis Server Process'
-
-            # IDE/Editor processes
-            elif any(ide in cmd.lower() for ide in ['code', 'vscode', 'vim', 'nvim', 'emacs', 'sublime', 'atom']):
-                result['category'] = 'Development IDE'
-                result['is_user_process'] = True
-
-                if 'code' in cmd.lower() or 'vscode' in cmd.lower():
-                    result['app_name'] = 'VS Code'
-                    result['description'] = 'Visual Studio Code'
-                elif 'vim' in cmd.lower():
-                    result['app_name'] = 'Vim'
-                    result['description'] = 'Vim Text Editor'
-                elif 'nvim' in cmd.lower():
-                    result['app_name'] = 'Neovim'
-                    result['description'] = 'Neovim Text Editor'
-                elif 'emacs' in cmd.lower():
-                    result['app_name'] = 'Emacs'
-                    result['description'] = 'Emacs Text Editor'
-
-        # Check if it's a user process based on location
-        try:
-            cwd = proc.cwd()
-            if cwd and ('/Users/' in cwd or '/home/' in cwd):
-                result['is_user_process'] = True
-                if result['category'] == 'System':
-                    result['category'] = 'User Process'
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            pass
-
-        return result
+    def _describe_git(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                      cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe a Git process"""
+        result['category'] = 'Version Control'
+        result['is_user_process'] = True
+        result['app_name'] = 'Git'
+
+        # Identify git operation
+        for op in _GIT_OPERATIONS:
+            if op in cmd:
+                result['description'] = f"Git: {op} operation"
+                break
+        else:
+            result['description'] = 'Git Operation'
+
+    def _describe_database(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                           cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe a database server process"""
+        result['category'] = 'Database'
+        result['is_user_process'] = True
+
+        if 'postgres' in cmd_lower:
+            result['app_name'] = 'PostgreSQL'
+            result['description'] = 'PostgreSQL Database Process'
+        elif 'mysql' in cmd_lower:
+            result['app_name'] = 'MySQL'
+            result['description'] = 'MySQL Database Process'
+        elif 'mongodb' in cmd_lower or 'mongod' in cmd_lower:
+            result['app_name'] = 'MongoDB'
+            result['description'] = 'MongoDB Database Process'
+        elif 'redis' in cmd_lower:
+            result['app_name'] = 'Redis'
+            result['description'] = 'Redis Server Process'
+
+    def _describe_ide(self, cmdline: List[str], cmd: str, cmd_lower: str,
+                      cwd: Optional[str], result: Dict[str, Any]) -> None:
+        """Describe an IDE or editor process"""
+        result['category'] = 'Development IDE'
+        result['is_user_process'] = True
+
+        if 'code' in cmd_lower or 'vscode' in cmd_lower:
+            result['app_name'] = 'VS Code'
+            result['description'] = 'Visual Studio Code'
+        elif 'vim' in cmd_lower:
+            result['app_name'] = 'Vim'
+            result['description'] = 'Vim Text Editor'
+        elif 'nvim' in cmd_lower:
+            result['app_name'] = 'Neovim'
+            result['description'] = 'Neovim Text Editor'
+        elif 'emacs' in cmd_lower:
+            result['app_name'] = 'Emacs'
+            result['description'] = 'Emacs Text Editor'
+
+    def _is_hidden_app(self, info: ProcInfo) -> bool:
+        """Whether info is an editor, VS Code or Git process, which neither view lists"""
+        if info.app_name.lower() in self._hidden_app_names:
+            return True
+
+        # Filter out VS Code related processes, and Git operations unless they're
+        # long-running servers. Performance: the description is lowercased once for both
+        desc_lower = info.description.lower()
+        return 'visual studio code' in desc_lower or 'git version control' in desc_lower
 
     def _build_process_lookup(self, all_procs: List[psutil.Process]) -> Dict[str, List[Dict]]:
         """Pre-compute a lookup dictionary of process info keyed by working directory.
 
         This reduces _find_related_processes from O(N*M) to O(N+M) complexity.
+        Performance: reads the fields already batched into proc.info (IDENTIFY_ATTRS),
+        so building the index costs no further syscalls.
         """
-        lookup = {'by_cwd': {}, 'by_parent': {}}
+        by_cwd = defaultdict(list)
+        by_parent = defaultdict(list)
 
         for proc in all_procs:
-            try:
-                pid = proc.pid
-                proc_name = proc.name().lower()
-
-                try:
-                    cmdline = proc.cmdline()
-                    cmd_str = ' '.join(cmdline).lower() if cmdline else ''
-                except (psutil.AccessDenied, psutil.NoSuchProcess):
-                    cmdline = []
-                    cmd_str = ''
-
-                try:
-                    cwd = proc.cwd()
-                except (psutil.AccessDenied, psutil.NoSuchProcess):
-                    cwd = None
-
-                try:
-                    parent = proc.parent()
-                    parent_pid = parent.pid if parent else None
-                except (psutil.AccessDenied, psutil.NoSuchProcess):
-                    parent_pid = None
-
-                proc_info = {
-                    'pid': pid,
-                    'name': proc.name(),
-                    'proc_name_lower': proc_name,
-                    'cmdline': cmdline,
-                    'cmd_str': cmd_str,
-                    'cwd': cwd,
-                    'parent_pid': parent_pid,
-                    'proc': proc
-                }
-
-                # Index by working directory
-                if cwd:
-                    if cwd not in lookup['by_cwd']:
-                        lookup['by_cwd'][cwd] = []
-                    lookup['by_cwd'][cwd].append(proc_info)
-
-                # Index by parent PID
-                if parent_pid:
-                    if parent_pid not in lookup['by_parent']:
-                        lookup['by_parent'][parent_pid] = []
-                    lookup['by_parent'][parent_pid].append(proc_info)
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            info = proc.info
+            name = info['name']
+            if name is None:
                 continue
 
-        return lookup
-
-    def _find_related_processes(self, main_proc_info: Dict[str, Any], lookup: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
+            cmdline = info['cmdline'] or []
+            cwd = info['cwd']
+            parent_pid = info['ppid']
+
+            proc_info = {
+                'pid': info['pid'],
+                'name': name,
+                'proc_name_lower': name.lower(),
+                'cmdline': cmdline,
+                # Joined and lowercased on first use by _find_related_processes()
+                'cmd_str': None,
+                'cwd': cwd,
+                'parent_pid': parent_pid,
+                'info': info
+            }
+
+            # Index by working directory
+            if cwd:
+                by_cwd[cwd].append(proc_info)
+
+            # Index by parent PID
+            if parent_pid:
+                by_parent[parent_pid].append(proc_info)
+
+        # Plain dicts, so lookups of absent keys don't grow the index
+        return {'by_cwd': dict(by_cwd), 'by_parent': dict(by_parent)}
+
+    def _find_related_processes(self, main_proc_info: ProcInfo, lookup: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
         """Find processes that are related to the main process using pre-computed lookup."""
         related = []
-        main_pid = main_proc_info['pid']
-        main_cwd = main_proc_info.get('cwd', '')
+        main_pid = main_proc_info.pid
+        main_cwd = main_proc_info.cwd or ''
 
-        # Get candidates from same working directory
+        # Get candidates from same working directory, then child processes.
+        # Performance: one dict probe per bucket instead of a membership test plus index
         candidates = []
-        if main_cwd and main_cwd in lookup['by_cwd']:
-            candidates.extend(lookup['by_cwd'][main_cwd])
-
-        # Get child processes
-        if main_pid in lookup['by_parent']:
-            candidates.extend(lookup['by_parent'][main_pid])
+        if main_cwd:
+            candidates.extend(lookup['by_cwd'].get(main_cwd, ()))
+        candidates.extend(lookup['by_parent'].get(main_pid, ()))
 
         # Remove duplicates based on PID
         seen_pids = {main_pid}
@@ -579,30 +1004,39 @@ class ProcessIdentifier:
                 unique_candidates.append(c)
 
         for proc_info in unique_candidates:
-            try:
-                proc_name = proc_info['proc_name_lower']
-                cmd_str = proc_info['cmd_str']
-                same_cwd = main_cwd and proc_info['cwd'] == main_cwd
-                is_child = proc_info['parent_pid'] == main_pid
+            same_cwd = main_cwd and proc_info['cwd'] == main_cwd
+            is_child = proc_info['parent_pid'] == main_pid
+
+            # Every rule needs a shared working directory or a parent link
+            if not same_cwd and not is_child:
+                continue
 
-                # Identify related process types
-                related_type = None
+            proc_name = proc_info['proc_name_lower']
+            # Performance: only processes that share a cwd or parent with a listed one
+            # ever get here, so the join is paid for those alone, and once per scan
+            cmd_str = proc_info['cmd_str']
+            if cmd_str is None:
+                cmd_str = proc_info['cmd_str'] = ' '.join(proc_info['cmdline']).lower()
 
+            # Identify related process types
+            related_type = None
+            patterns = self._rel_patterns
+
+            if same_cwd:
                 # UV package manager
-                if 'uv' in proc_name and same_cwd:
+                if 'uv' in proc_name:
                     related_type = 'Package Manager (UV)'
                 # Virtual environment
-                elif (('virtualenv' in cmd_str or 'pipenv' in cmd_str) and
-                      'multiprocessing' not in cmd_str and same_cwd):
+                elif patterns['venv'].search(cmd_str) and 'multiprocessing' not in cmd_str:
                     related_type = 'Virtual Environment'
                 # NPM dev scripts
-                elif 'npm' in cmd_str and ('run' in cmd_str or 'dev' in cmd_str) and same_cwd:
+                elif 'npm' in cmd_str and patterns['npm_script'].search(cmd_str):
                     related_type = 'NPM Script'
                 # Node package managers
-                elif ('yarn' in proc_name or 'pnpm' in proc_name) and same_cwd:
+                elif patterns['node_pm'].search(proc_name):
                     related_type = f'Package Manager ({proc_name.upper()})'
                 # Webpack/bundlers
-                elif ('webpack' in cmd_str or 'vite' in cmd_str or 'esbuild' in cmd_str) and same_cwd:
+                elif patterns['bundler'].search(cmd_str):
                     if 'webpack' in cmd_str:
                         related_type = 'Bundler (Webpack)'
                     elif 'vite' in cmd_str:
@@ -610,68 +1044,169 @@ class ProcessIdentifier:
                     else:
                         related_type = 'Bundler (esbuild)'
                 # Nodemon
-                elif 'nodemon' in cmd_str and same_cwd:
+                elif 'nodemon' in cmd_str:
                     related_type = 'Auto-restart (Nodemon)'
+
+            if related_type is None and is_child:
                 # Python workers or helper processes
-                elif is_child and 'python' in proc_name:
-                    if any(keyword in cmd_str for keyword in ['worker', 'celery', 'rq', 'huey']):
+                if 'python' in proc_name:
+                    if patterns['worker'].search(cmd_str):
                         related_type = 'Worker Process'
                 # Gunicorn/Uvicorn workers
-                elif is_child and ('gunicorn' in cmd_str or 'uvicorn' in cmd_str):
+                elif patterns['web_worker'].search(cmd_str):
                     related_type = 'Web Server Worker'
 
-                if related_type:
-                    proc = proc_info['proc']
-                    related.append({
-                        'pid': proc_info['pid'],
-                        'name': proc_info['name'],
-                        'type': related_type,
-                        'cpu_percent': proc.cpu_percent(),
-                        'memory_mb': proc.memory_info().rss / 1024 / 1024,
-                        'cmdline': proc_info['cmdline'][:3] if proc_info['cmdline'] else []
-                    })
+            if related_type:
+                # Performance: reuse the batched fields instead of re-reading /proc;
+                # this also gives a real cpu_percent rather than a back-to-back sample
+                info = proc_info['info']
+                memory_info = info['memory_info']
+                related.append({
+                    'pid': proc_info['pid'],
+                    'name': proc_info['name'],
+                    'type': related_type,
+                    'cpu_percent': info['cpu_percent'] or 0.0,
+                    'memory_mb': memory_info.rss / 1048576 if memory_info else 0.0,
+                    'cmdline': proc_info['cmdline'][:3] if proc_info['cmdline'] else []
+                })
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return related
+
+    def snapshot(self, show_all=False) -> List[ProcInfo]:
+        """Get the process list for a view, scanning at most once per cache_duration
+
+        Thread-safe: concurrent callers within the window share one scan.
+        """
+        with self._cache_lock:
+            current_time = time.monotonic()
+            cached = self._cached_processes.get(show_all)
+            if cached is not None and (current_time - self._cache_timestamp[show_all]) < self.cache_duration:
+                return cached
+
+            self._path_cache = {}
+            if show_all:
+                processes = self._scan_all_processes()
+            else:
+                processes = self._scan_user_processes()
+
+            self._cached_processes[show_all] = processes
+            self._cache_timestamp[show_all] = current_time
+            return processes
+
+    def invalidate(self):
+        """Drop cached process lists so the next snapshot() rescans (e.g. after a kill)"""
+        with self._cache_lock:
+            self._cached_processes.clear()
+            self._cache_timestamp.clear()
+            self._walk = None
+
+    def _process_walk(self) -> tuple:
+        """(procs, ppid_map) from one process table walk, reused for cache_duration
+
+        Performance: when both views are being watched they refresh back to back,
+        and the second one reuses this walk instead of re-reading the process table.
+        Called with _cache_lock held.
+        """
+        current_time = time.monotonic()
+        if self._walk is not None and (current_time - self._walk[0]) < self.cache_duration:
+            return self._walk[1], self._walk[2]
+
+        if psutil.LINUX:
+            procs = self._linux_walk()
+        else:
+            procs = list(psutil.process_iter(['pid', 'ppid', 'name']))
+        ppid_map = {proc.info['pid']: (proc.info['ppid'], proc.info['name']) for proc in procs}
+        self._walk = (current_time, procs, ppid_map)
+        self._procs_by_pid = {proc.pid: proc for proc in procs}
+        return procs, ppid_map
+
+    def cached_process(self, pid: int) -> Optional[psutil.Process]:
+        """The Process object the last walk used for pid, or None if it wasn't seen
+
+        Reusing it keeps psutil's per-instance state, such as the cpu_percent()
+        interval the scans keep running. The PID may have exited or been reused
+        since, so callers should check is_running() before acting on it.
+        """
+        return self._procs_by_pid.get(pid)
+
+    def _linux_walk(self) -> List[psutil.Process]:
+        """Non-kernel processes with pid, ppid and name in proc.info (Linux only)
+
+        Performance: name and ppid come straight from one /proc/<pid>/stat read per
+        PID, and kernel threads are dropped before any psutil call. Process objects
+        are reused between walks, which also lets cpu_percent() measure the interval
+        since the last scan.
+        """
+        procs = []
+        proc_cache = {}
+        for pid, stat in _fast_proc_snapshot().items():
+            if stat['flags'] & PF_KTHREAD:
                 continue
+            try:
+                # A different starttime means the PID was recycled
+                cached = self._proc_cache.get(pid)
+                if cached is not None and cached[0] == stat['starttime']:
+                    proc = cached[1]
+                else:
+                    proc = psutil.Process(pid)
 
-        return related
+                # comm is truncated to 15 characters; name() recovers the full one
+                name = stat['comm']
+                if len(name) >= 15:
+                    try:
+                        name = proc.name()
+                    except psutil.AccessDenied:
+                        pass
+            except psutil.NoSuchProcess:
+                continue
+            proc.info = {'pid': pid, 'ppid': stat['ppid'], 'name': name}
+            proc_cache[pid] = (stat['starttime'], proc)
+            procs.append(proc)
+
+        # Replacing the cache wholesale drops PIDs that have exited
+        self._proc_cache = proc_cache
+        return procs
 
-    def get_user_processes(self) -> List[Dict[str, Any]]:
+    def get_user_processes(self) -> List[ProcInfo]:
         """Get all processes that are likely user-initiated, excluding system processes
 
         Uses caching to avoid expensive scans on every request.
         """
-        # Check cache first
-        current_time = time.time()
-        if self._cached_processes is not None and (current_time - self._cache_timestamp) < self.cache_duration:
-            return self._cached_processes
+        return self.snapshot(show_all=False)
 
-        processes = []
+    def get_all_processes_enhanced(self) -> List[ProcInfo]:
+        """Get more processes with enhanced identification, but still excluding pure system processes
+
+        Uses caching to avoid expensive scans on every request.
+        """
+        return self.snapshot(show_all=True)
 
-        # Performance: Quick filter of process names before expensive operations
-        # This reduces the number of identify_process() calls significantly
-        excluded_names = {'code', 'git', 'vim', 'nvim', 'emacs', 'sublime', 'atom',
-                         'code-helper', 'chrome', 'firefox', 'safari', 'slack', 'spotify',
-                         'finder', 'dock', 'systemuiserver', 'windowserver'}
+    def _scan_user_processes(self) -> List[ProcInfo]:
+        """Scan for processes that are likely user-initiated, excluding system processes"""
+        processes = []
 
-        # First pass: Quick filter and collect candidate processes
+        # First pass: Quick filter and collect candidate processes. Parent lookups for
+        # identify_from_info() come from the same walk
         candidate_procs = []
-        for proc in psutil.process_iter(['pid', 'name']):
+        procs, ppid_map = self._process_walk()
+        for proc in procs:
             try:
                 proc_name_lower = proc.info['name'].lower() if proc.info['name'] else ''
 
                 # Skip obviously excluded processes early
-                if any(excluded in proc_name_lower for excluded in excluded_names):
+                if self._excluded_name_regex.search(proc_name_lower):
                     continue
 
                 # Skip system processes (most start with these paths)
                 try:
                     exe = proc.exe()
-                    if exe and ('/System/' in exe or '/usr/libexec/' in exe or '/usr/sbin/' in exe):
-                        continue
-                except (psutil.AccessDenied, psutil.NoSuchProcess):
-                    pass
+                except psutil.AccessDenied:
+                    exe = None
+                if exe and self._system_exe_regex.search(exe):
+                    continue
 
+                # Performance: every field the rest of the scan needs, in one batched fetch
+                proc.info = self._fetch_info(proc)
                 candidate_procs.append(proc)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
@@ -679,88 +1214,76 @@ class ProcessIdentifier:
         # Build lookup once for all related process searches
         process_lookup = self._build_process_lookup(candidate_procs)
 
+        # Only check ports for processes that might be servers
+        # This is a huge performance win: only their sockets get resolved
+        server_procs = [proc for proc in candidate_procs
+                        if proc.info['name'] and self._server_name_regex.search(proc.info['name'].lower())]
+        server_pids = {proc.pid for proc in server_procs}
+
+        # Scan listening sockets once for the whole system rather than per process
+        listen_map = self.build_listen_map(server_procs)
+
         # Second pass: Identify only candidate processes
         for proc in candidate_procs:
-            try:
-                # Only check ports for processes that might be servers
-                # This is a huge performance win
-                proc_name = proc.name().lower() if hasattr(proc, 'name') else ''
-                might_have_ports = any(keyword in proc_name for keyword in
-                                      ['python', 'node', 'npm', 'flask', 'django', 'uvicorn',
-                                       'gunicorn', 'streamlit', 'gradio', 'vite', 'webpack'])
-
-                info = self.identify_process(proc, check_ports=might_have_ports)
-                if info:
-                    # Filter out system processes and unwanted categories
-                    if info['category'] in ['System', 'User Process', 'Development IDE']:
-                        continue
-
-                    # Also filter out specific apps we don't want to show
-                    app_name_lower = info['app_name'].lower()
-                    if app_name_lower in ['code', 'git', 'vim', 'nvim', 'emacs', 'sublime', 'atom']:
-                        continue
-
-                    # Filter out VS Code related processes
-                    if 'visual studio code' in info['description'].lower():
-                        continue
-
-                    # Filter out Git operations unless they're long-running servers
-                    if app_name_lower == 'git' or 'git version control' in info['description'].lower():
-                        continue
-
-                    # Find related/bundled processes using pre-computed lookup
-                    info['related_processes'] = self._find_related_processes(info, process_lookup)
-
-                    processes.append(info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+            might_have_ports = proc.pid in server_pids
+
+            info = self.identify_from_info(proc.info, check_ports=might_have_ports,
+                                           listen_map=listen_map, ppid_map=ppid_map)
+            if info:
+                # Filter out system processes and unwanted categories
+                if info.category in self._hidden_categories:
+                    continue
+
+                # Also filter out specific apps we don't want to show
+                if self._is_hidden_app(info):
+                    continue
 
-        # Update cache
-        self._cached_processes = processes
-        self._cache_timestamp = current_time
+                # Find related/bundled processes using pre-computed lookup
+                info.related_processes = self._find_related_processes(info, process_lookup)
+
+                processes.append(info)
 
         return processes
 
-    def get_all_processes_enhanced(self) -> List[Dict[str, Any]]:
-        """Get more processes with enhanced identification, but still excluding pure system processes"""
+    def _scan_all_processes(self) -> List[ProcInfo]:
+        """Scan for processes with enhanced identification, still excluding pure system processes"""
         processes = []
 
-        # First pass: collect all process objects for relationship detection
-        all_procs = list(psutil.process_iter())
+        # First pass: collect all process objects, with their fields fetched in one
+        # batch per process (proc.info, as process_iter(attrs=...) provides)
+        all_procs = []
+        for proc in self._process_walk()[0]:
+            try:
+                proc.info = self._fetch_info(proc)
+            except psutil.NoSuchProcess:
+                continue
+            all_procs.append(proc)
 
         # Build lookup once for all related process searches
         process_lookup = self._build_process_lookup(all_procs)
 
+        # Scan listening sockets once for the whole system; parent links come from the batch
+        listen_map = self.build_listen_map(all_procs)
+        ppid_map = {proc.info['pid']: (proc.info['ppid'], proc.info['name']) for proc in all_procs}
+
         for proc in all_procs:
-            try:
-                info = self.identify_process(proc)
-                if info:
-                    # Exclude system processes and unwanted categories
-                    if info['category'] in ['System', 'User Process', 'Development IDE']:
-                        # For "Show more", include some system processes if they're recognizable apps
-                        if info['category'] == 'System' and any(known in info['name'].lower()
-                                                                  for known in ['docker', 'postgres', 'mysql',
-                                                                               'redis', 'mongo', 'elastic']):
-                            info['related_processes'] = self._find_related_processes(info, process_lookup)
-                            processes.append(info)
-                        continue
-
-                    # Also filter out IDEs and Git even in "show more"
-                    app_name_lower = info['app_name'].lower()
-                    if app_name_lower in ['code', 'git', 'vim', 'nvim', 'emacs', 'sublime', 'atom']:
-                        continue
-
-                    if 'visual studio code' in info['description'].lower():
-                        continue
-
-                    if app_name_lower == 'git' or 'git version control' in info['description'].lower():
-                        continue
-
-                    # Find related/bundled processes using pre-computed lookup
-                    info['related_processes'] = self._find_related_processes(info, process_lookup)
-
-                    processes.append(info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+            info = self.identify_from_info(proc.info, listen_map=listen_map, ppid_map=ppid_map)
+            if info:
+                # Exclude system processes and unwanted categories
+                if info.category in self._hidden_categories:
+                    # For "Show more", include some system processes if they're recognizable apps
+                    if info.category == 'System' and self._system_app_regex.search(info.name.lower()):
+                        info.related_processes = self._find_related_processes(info, process_lookup)
+                        processes.append(info)
+                    continue
+
+                # Also filter out IDEs and Git even in "show more"
+                if self._is_hidden_app(info):
+                    continue
+
+                # Find related/bundled processes using pre-computed lookup
+                info.related_processes = self._find_related_processes(info, process_lookup)
+
+                processes.append(info)
 
         return processes
\ No newline at end of file
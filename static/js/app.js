@@ -37,8 +37,43 @@ socket.on('connect', () => {
     requestProcesses();
 });
 
+// Typed array views for the binary column typecodes used by the server
+const BINARY_COLUMN_TYPES = {
+    i: Int32Array,
+    f: Float32Array,
+    B: Uint8Array
+};
+
+// Rebuild process objects from the columnar process_update payload
+// ({count, columns: {field: [values...]}, binary_columns: {field: typecode}}).
+// Binary columns arrive as ArrayBuffers and are read through typed arrays.
+// A plain array is the old list-of-objects format and is passed through unchanged.
+function unpackProcesses(payload) {
+    if (Array.isArray(payload)) {
+        return payload;
+    }
+
+    const binaryColumns = payload.binary_columns || {};
+    const columns = {};
+    for (const [field, values] of Object.entries(payload.columns)) {
+        const TypedArray = BINARY_COLUMN_TYPES[binaryColumns[field]];
+        columns[field] = TypedArray ? new TypedArray(values) : values;
+    }
+
+    const fields = Object.keys(columns);
+    const unpacked = new Array(payload.count);
+    for (let i = 0; i < payload.count; i++) {
+        const proc = {};
+        for (const field of fields) {
+            proc[field] = columns[field][i];
+        }
+        unpacked[i] = proc;
+    }
+    return unpacked;
+}
+
 socket.on('process_update', (data) => {
-    processes = data.processes;
+    processes = unpackProcesses(data.processes);
     updateSystemInfo(data.system_info);
     renderAppPreviews();
 
@@ -577,6 +612,12 @@ function updateSystemInfo(systemInfo) {
     document.getElementById('cpu-usage').innerHTML = `CPU: <span class="metric">${cpuValue}</span>%`;
     document.getElementById('memory-usage').innerHTML = `MEM: <span class="metric">${memValue}</span>%`;
 
+    // Server adapts its refresh interval to how long scans take
+    if (systemInfo.refresh_interval) {
+        const refreshRate = (1 / systemInfo.refresh_interval).toFixed(1);
+        document.getElementById('refresh-rate').innerHTML = `REFRESH: <span class="metric">${refreshRate}</span>Hz`;
+    }
+
     // Add warning color if CPU/MEM is high
     const cpuElement = document.getElementById('cpu-usage');
     const memElement = document.getElementById('memory-usage');
@@ -598,8 +639,8 @@ function updateSystemInfo(systemInfo) {
     }
 }
 
-// Auto-refresh every 2 seconds
-setInterval(requestProcesses, 2000);
+// No polling needed: after the first request the server pushes
+// process_update every 2 seconds to subscribed clients
 
 // Initial load
 requestProcesses();